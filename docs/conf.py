@@ -2,31 +2,50 @@ import os
 import sys
 from datetime import datetime
 
-# Make package importable for autodoc (if enabled later)
-sys.path.insert(0, os.path.abspath("../src"))
-
 project = "medscheduler"
 author = "Carolina Gonzalez Galtier"
-copyright = f"{datetime.now():%Y}, {author}"
+
+# Honour SOURCE_DATE_EPOCH (reproducible-builds convention) so two builds of
+# the same sources produce identical output; fall back to the current year.
+_source_date_epoch = os.environ.get("SOURCE_DATE_EPOCH")
+if _source_date_epoch:
+    _year = datetime.utcfromtimestamp(int(_source_date_epoch)).year
+else:
+    _year = datetime.utcnow().year
+copyright = f"{_year}, {author}"
 
 extensions = [
     "myst_parser",
-    "sphinx.ext.autodoc",
-    "sphinx.ext.napoleon",
-    "sphinx.ext.autosectionlabel",
-    "sphinx.ext.intersphinx",
     "sphinx_copybutton",
-    "sphinx.ext.viewcode",
 ]
 
+# viewcode re-highlights every module into an extra HTML page per build;
+# only pay for that on full builds (releases), not PR previews.
+if os.environ.get("MEDSCHED_FULL_DOCS"):
+    extensions.append("sphinx.ext.viewcode")
+
+# Only make the package importable when an extension actually imports it
+# (viewcode today, autodoc if it ever comes back); unconditional insertion
+# would pull pandas/numpy into every build worker's startup.
+if {"sphinx.ext.viewcode", "sphinx.ext.autodoc"} & set(extensions):
+    sys.path.insert(0, os.path.abspath("../src"))
+
 # Recognize both .md and .rst files
 source_suffix = {
     ".md": "markdown",
     ".rst": "restructuredtext",
 }
 
-# MyST options
-myst_enable_extensions = ["colon_fence", "deflist", "attrs_block", "attrs_inline"]
+# MyST options — none of the optional syntax extensions (colon_fence,
+# deflist, attrs_block, attrs_inline) are used in the docs, so keep the
+# parser lean; add back individual entries if a page starts needing one.
+myst_enable_extensions = ()
+myst_heading_anchors = 0
+
+# Skip copying the markdown sources into _build/html/_sources/ — roughly
+# halves the number of files written per build, and nothing links to them.
+html_copy_source = False
+html_show_sourcelink = False
 
 # Theme
 html_theme = "pydata_sphinx_theme"